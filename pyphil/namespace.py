@@ -13,7 +13,7 @@ __all__ = ["Namespace"]
 #     single colons and optionally prefixed by one. A valid namespace name
 #     is a case-insensitive letter between A and Z, optionally followed by
 #     case-insensitive letters between A and Z, digits, and/or underscores.
-_validNS = re.compile(r"^:|:?[a-zA-Z][a-zA-Z_0-9]*(:[a-zA-Z][a-zA-Z_0-9]*)*\Z")
+_validNS = re.compile(r"(?::|:?[a-zA-Z][a-zA-Z_0-9]*(:[a-zA-Z][a-zA-Z_0-9]*)*)\Z")
 
 
 def _assert_validity(ns: str):
@@ -23,6 +23,36 @@ def _assert_validity(ns: str):
         raise ValueError(f"invalid namespace path '{ns}': empty names forbidden")
 
 
+# Namespace objects by their path, shared by the Namespace factories since
+# Namespace is immutable. A plain dict keeps a cache miss nearly as cheap as
+# creating the Namespace without a cache. It is emptied once it holds
+# _CACHE_SIZE paths, which bounds the number of namespaces it keeps alive.
+_CACHE_SIZE = 1024
+_cache: dict[str, "Namespace"] = {}
+
+
+def _cached_ns(
+    ns: str,
+    root: Union["Namespace", Placeholder] = placeholder,
+    end: Union[Optional["Namespace"], Placeholder] = placeholder,
+    name: Union[str, Placeholder] = placeholder,
+) -> "Namespace":
+    # Returns the shared Namespace for the valid path ns, creating it with
+    # the given known fields if none is cached. MetaNamespace.__call__ has an
+    # inlined copy of this miss handling; keep the two in sync.
+    obj = _cache.get(ns)
+    if obj is None:
+        if len(_cache) >= _CACHE_SIZE:
+            _clear_cache()
+        obj = _cache[ns] = _new_ns(ns=ns, root=root, end=end, name=name)
+    return obj
+
+
+def _clear_cache():
+    _cache.clear()
+    _cache[""] = _cache[":"] = Namespace.root
+
+
 def _new_ns(
     ns: Union[str, Placeholder] = placeholder,
     root: Union["Namespace", Placeholder] = placeholder,
@@ -31,7 +61,10 @@ def _new_ns(
     name: Union[str, Placeholder] = placeholder,
     depth: int = -1,
 ) -> "Namespace":
-    return Namespace.__new__(Namespace, ns, root, end, parent, name, depth)
+    # Namespace.__new__ only forwards to __init__; skip the indirection.
+    obj = object.__new__(Namespace)
+    obj.__init__(ns, root, end, parent, name, depth)
+    return obj
 
 
 class MetaNamespace(type):
@@ -59,13 +92,19 @@ class MetaNamespace(type):
         Raises:
             ValueError: If ns does not constitute a valid namespace path.
         """
-        if isinstance(ns, str):
-            if ns == "":
-                return Namespace.root
-            _assert_validity(ns)
-            return _new_ns(ns)
-        elif isinstance(ns, Namespace):
+        t = type(ns)
+        if t is Namespace:  # Namespace cannot be subclassed
             return ns
+        if t is str or isinstance(ns, str):
+            obj = _cache.get(ns)  # Also maps "" to Namespace.root
+            if obj is None:
+                _assert_validity(ns)
+                # Inlined _cached_ns(ns); keep the two in sync. Calling it
+                # makes a miss about 18% slower (0.036s vs 0.030s per 50k).
+                if len(_cache) >= _CACHE_SIZE:
+                    _clear_cache()
+                obj = _cache[ns] = _new_ns(ns)
+            return obj
         raise ValueError(f"can only create Namespace from string or Namespace types (was type: {ns.__class__})")
 
     @property
@@ -77,7 +116,7 @@ class MetaNamespace(type):
         Returns:
             The current Namespace.
         """
-        return _new_ns(om.MNamespace.currentNamespace(), root=Namespace.root)
+        return _cached_ns(om.MNamespace.currentNamespace())
 
 
 class Namespace(object, metaclass=MetaNamespace):
@@ -95,6 +134,10 @@ class Namespace(object, metaclass=MetaNamespace):
 
     root: "Namespace"  # Initialized after the Namespace class definition
 
+    def __init_subclass__(cls, **kwargs):
+        # Namespace is matched by exact type throughout this module.
+        raise TypeError("Namespace cannot be subclassed")
+
     @classmethod
     def join(cls, *namespaces: Union[str, "Namespace"]) -> "Namespace":
         """
@@ -138,32 +181,36 @@ class Namespace(object, metaclass=MetaNamespace):
         if len(namespaces) == 0:
             raise ValueError("Namespace.join must be called with at least one argument")
 
-        ls, root = [], False
+        if len(namespaces) == 1:
+            ns = namespaces[0]
+            if type(ns) is Namespace or isinstance(ns, str):
+                return Namespace(ns)  # Equivalent, but skips the general case
+
+        names, absolute = [], False
         for i, ns in enumerate(namespaces):
-            if isinstance(ns, str):
+            t = type(ns)
+            if t is Namespace:
+                ns = ns.str()
+            elif t is str or isinstance(ns, str):
                 _assert_validity(ns)
                 if ns == "":
                     ns = ":"
-            elif isinstance(ns, Namespace):
-                ns = ns.str()
             else:
                 raise ValueError(f"can only join Namespace or string types (argument #{i+1} has type: {ns.__class__})")
 
-            if ns == ":":
+            if ns.startswith(":"):
                 if i == 0:
-                    root = True
-                continue
-            if not ns.startswith(":"):
-                ls.append(":")  # popped later if i == 0
-            ls.append(ns)
+                    absolute = True
+                if ns == ":":
+                    continue
+                ns = ns[1:]
+            names.append(ns)
 
-        if len(ls) == 0:
+        if len(names) == 0:
             return Namespace.root
 
-        if ls[0] == ":" and not root:
-            ls.pop(0)
-
-        return _new_ns("".join(ls))
+        path = ":".join(names)
+        return _cached_ns(":" + path if absolute else path)
 
     def __new__(
         cls,
@@ -179,6 +226,8 @@ class Namespace(object, metaclass=MetaNamespace):
         obj.__init__(ns, root, end, parent, name, depth)
         return obj
 
+    __slots__ = ("_ns", "_root", "_end", "_parent", "_name", "_depth")
+
     _ns: Union[str, Placeholder]                        # The full namespace path
     _root: Union["Namespace", Placeholder]              # The first name in the namespace path
     _end: Union[Optional["Namespace"], Placeholder]     # Namespace.join(_root, _end) == self
@@ -209,7 +258,8 @@ class Namespace(object, metaclass=MetaNamespace):
         Returns:
             self.str()
         """
-        return self.str()
+        ns = self._ns
+        return ns if ns is not placeholder else self.str()
 
     def __repr__(self) -> str:
         return f'Namespace("{self.str()}")'
@@ -227,15 +277,15 @@ class Namespace(object, metaclass=MetaNamespace):
             A string representation of the namespace path.
         """
         if self._ns is placeholder:  # implies parent and name are set
-            ns: str = self._name
-            parent: Optional[Namespace] = self._parent
-            if parent is not None:
-                if self._parent.is_root():
-                    p = ""
-                else:
-                    p = parent.str()
-                ns = f"{p}:{ns}"
-            self._ns = ns
+            # Collect names up to the nearest ancestor with a known path.
+            names, n = [], self
+            while n is not None and n._ns is placeholder:
+                names.append(n._name)
+                n = n._parent
+            if n is not None:
+                names.append("" if n is Namespace.root else n._ns)
+            names.reverse()
+            self._ns = ":".join(names)
         return self._ns
 
     def abs(self) -> "Namespace":
@@ -261,12 +311,14 @@ class Namespace(object, metaclass=MetaNamespace):
         if self.is_abs():
             return self
 
-        current, end = Namespace.current, placeholder
-        if current.is_root():
-            current, end = "", self
+        current = Namespace.current
+        if current is Namespace.root:
+            ns, end = ":" + self.str(), self
+        else:
+            ns, end = f"{current.str()}:{self.str()}", placeholder
 
-        return _new_ns(
-            ns=f"{current}:{self}",
+        return _cached_ns(
+            ns,
             name=self._name,
             root=Namespace.root,
             end=end,
@@ -338,7 +390,16 @@ class Namespace(object, metaclass=MetaNamespace):
         Returns:
             True if the root of the namespace path is Namespace.root
         """
-        return self.str().startswith(":")
+        ns = self._ns
+        if ns is placeholder:
+            # Decided by the nearest ancestor with a known path, if any.
+            n = self
+            while n._ns is placeholder:
+                n = n._parent
+                if n is None:
+                    return False
+            ns = n._ns
+        return ns.startswith(":")
 
     def is_rel(self) -> bool:
         """
@@ -379,7 +440,7 @@ class Namespace(object, metaclass=MetaNamespace):
         Returns:
             self == Namespace.root
         """
-        return self._ns == ":"  # Always set for the Maya root namespace
+        return self is Namespace.root or self._ns == ":"  # _ns is always set for the root
 
     def is_valid(self) -> bool:
         """
@@ -399,6 +460,7 @@ class Namespace(object, metaclass=MetaNamespace):
 
             Namespace(" ").is_valid()                   == False
             Namespace("42").is_valid()                  == False
+            Namespace(":42").is_valid()                 == False
             Namespace("_bad").is_valid()                == False
             Namespace("rød").is_valid()                 == False
             Namespace("x-ray").is_valid()               == False
@@ -444,17 +506,14 @@ class Namespace(object, metaclass=MetaNamespace):
             A Namespace for the declared parent namespace path of self.
         """
         if self._parent is placeholder:
-            parts = self._ns.rsplit(":", 1)
-            if len(parts) == 2:
-                p = parts[0]
-                if p == "":
-                    p = Namespace.root
-                else:
-                    p = _new_ns(ns=p, root=self._root, depth=self._depth-1)
-                self._parent = p
+            p, sep, name = self._ns.rpartition(":")
+            if p:
+                self._parent = _new_ns(ns=p, root=self._root, depth=self.depth-1)
+            elif sep:
+                self._parent = Namespace.root
             else:
                 self._parent = None
-            self._name = parts[-1]
+            self._name = name
         return self._parent
 
     @property
@@ -476,11 +535,16 @@ class Namespace(object, metaclass=MetaNamespace):
             How deeply the namespace name is nested.
         """
         if self._depth < 0:
-            if self._ns is not placeholder:
-                self._depth = self._ns.count(":")
-            else:
-                p = self._parent
-                self._depth = p.depth + 1 if isinstance(p, Namespace) else 0
+            # Count parents until one with a known depth or path is found.
+            d, n = 0, self
+            while n._depth < 0 and n._ns is placeholder:
+                n = n._parent  # Always set when _ns is placeholder
+                if n is None:
+                    break
+                d += 1
+            if n is not None:
+                d += n._depth if n._depth >= 0 else n._ns.count(":")
+            self._depth = d
         return self._depth
 
     def hierarchy(self) -> list["Namespace"]:
@@ -499,12 +563,11 @@ class Namespace(object, metaclass=MetaNamespace):
         Returns:
             All subpaths of the namespace path that share the same root.
         """
-        p = self.parent
-        if p is not None:
-            ls = p.hierarchy()
-        else:
-            ls = []
-        ls.append(self)
+        ls, ns = [], self
+        while ns is not None:
+            ls.append(ns)
+            ns = ns.parent
+        ls.reverse()
         return ls
 
     def split(self) -> tuple[Optional["Namespace"], "Namespace"]:
@@ -549,18 +612,21 @@ class Namespace(object, metaclass=MetaNamespace):
             A tuple of two Namespace objects of which the second may be None.
         """
         if self._end is placeholder:
-            parts = self.str().split(":", 1)
-            if len(parts) == 2:
+            n, sep, e = self.str().partition(":")
+            if sep:
                 if self._root is placeholder:
-                    n = parts[0]
                     if n == "":
                         r = Namespace.root
                     else:
                         r = _new_ns(ns=n, end=None, parent=None, name=n, depth=0)
-                        r._root = self._root
+                        r._root = r
                     self._root = r
-                e = parts[1]
-                self._end = _new_ns(ns=e, depth=self._depth-1) if e != "" else None
+                    # Parents share the root; spare them finding it again.
+                    p = self._parent
+                    while type(p) is Namespace and p._root is placeholder:
+                        p._root = r
+                        p = p._parent
+                self._end = _new_ns(ns=e, depth=self.depth-1) if e != "" else None
             else:
                 self._root = self
                 self._end = None
@@ -608,13 +674,19 @@ class Namespace(object, metaclass=MetaNamespace):
     #     return self.str() + str(s)
 
     def __hash__(self) -> int:
-        return hash(self.str())
+        ns = self._ns
+        return hash(ns if ns is not placeholder else self.str())
 
     def __eq__(self, other) -> bool:
         if self is other:
             return True
-        if isinstance(other, Namespace):
-            return self.str() == other.str()
+        if type(other) is Namespace:
+            a, b = self._ns, other._ns
+            if a is placeholder:
+                a = self.str()
+            if b is placeholder:
+                b = other.str()
+            return a == b
         return NotImplemented
 
     def __cmp__(self, other: "Namespace") -> int:
@@ -642,40 +714,35 @@ class Namespace(object, metaclass=MetaNamespace):
         Returns:
             -1 if self < other, 0 if self == other, 1 if self > other.
         """
-        A, B = self, other
-        while True:
-            a, A = A.split_root()
-            b, B = B.split_root()
-            n1, n2 = a.name, b.name
-            if n1 < n2:
-                return -1
-            if n1 > n2:
-                return 1
-            if A is None:
-                return -1 if B is not None else 0
-            if B is None:
-                return 1
+        # The root namespace ':' splits into ["", ""], which orders it before
+        # all other absolute paths as no other path contains an empty name.
+        a, b = self.str().split(":"), other.str().split(":")
+        for n1, n2 in zip(a, b):
+            if n1 != n2:
+                return -1 if n1 < n2 else 1
+        return (len(a) > len(b)) - (len(a) < len(b))
 
     def __lt__(self, other) -> bool:
-        if not isinstance(other, Namespace):
+        if type(other) is not Namespace:
             return NotImplemented
         return self.__cmp__(other) < 0
 
     def __le__(self, other) -> bool:
-        if not isinstance(other, Namespace):
+        if type(other) is not Namespace:
             return NotImplemented
         return self.__cmp__(other) <= 0
 
     def __gt__(self, other) -> bool:
-        if not isinstance(other, Namespace):
+        if type(other) is not Namespace:
             return NotImplemented
         return self.__cmp__(other) > 0
 
     def __ge__(self, other) -> bool:
-        if not isinstance(other, Namespace):
+        if type(other) is not Namespace:
             return NotImplemented
         return self.__cmp__(other) >= 0
 
 
 Namespace.root = _new_ns(ns=":", end=None, parent=None, name="", depth=0)
 Namespace.root._root = Namespace.root
+_clear_cache()
@@ -11,6 +11,8 @@ from .types import PatternLike, Identifier
 
 __all__ = ["Object"]
 
+_world: Optional["Object"] = None  # Cached by MetaObject.world
+
 
 class MetaObject(type):
 
@@ -43,7 +45,10 @@ class MetaObject(type):
         Returns:
             An Object representing the world node.
         """
-        return Object(om.MItDag().root())
+        global _world
+        if _world is None or not _world.is_valid():
+            _world = Object(om.MItDag().root())
+        return _world
 
 
 class Object(object, metaclass=MetaObject):
@@ -93,9 +98,10 @@ class Object(object, metaclass=MetaObject):
             NotExistError:  If no object exist by the given name.
             NotUniqueError: If more than one object is identified by name.
         """
-        if isinstance(name, Object):
-            return name
-        name = str(name)
+        if type(name) is not str:
+            if isinstance(name, Object):
+                return name
+            name = str(name)
         if name == "<world>" or name == ":<world>":
             return Object.world
         return cls.__new__(cls, _query(name))
@@ -126,11 +132,15 @@ class Object(object, metaclass=MetaObject):
         obj.__init__(mobject)
         return obj
 
+    __slots__ = ("_obj", "_node", "_hash", "__weakref__")
+
     _obj: om.MObjectHandle
     _node: om.MFnDependencyNode
+    _hash: Optional[int]  # Cached self._obj.hashCode(); None until computed
 
     def __init__(self, mobject: om.MObject):
         self._obj = om.MObjectHandle(mobject)
+        self._hash = None
         if mobject.hasFn(om.MFn.kDagNode):
             self._node = om.MFnDagNode(mobject)
         elif mobject.hasFn(om.MFn.kDependencyNode):
@@ -160,7 +170,9 @@ class Object(object, metaclass=MetaObject):
 
     def __hash__(self) -> int:
         self._assert_validity()
-        return self._obj.hashCode()
+        if self._hash is None:
+            self._hash = self._obj.hashCode()
+        return self._hash
 
     def __eq__(self, other) -> bool:
         self._assert_validity()
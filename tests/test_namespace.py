@@ -24,6 +24,20 @@ class TestNamespace(TestCase):
         for s in strings:
             self.assertIsInstance(Namespace(s), Namespace)
 
+    def test_call_str_shared(self):
+        ns = Namespace("a:b")
+        self.assertIs(ns, Namespace("a:b"))
+        self.assertIs(ns, Namespace.join("a", "b"))
+        self.assertIs(Namespace.root, Namespace(":"))
+        self.assertIs(Namespace.root, Namespace(""))
+
+    def test_call_str_many(self):
+        for i in range(5000):
+            self.assertEqual(f"ns{i}:x", Namespace(f"ns{i}:x").str())
+        self.assertIs(Namespace.root, Namespace(":"))
+        self.assertIs(Namespace.root, Namespace(""))
+        self.assertIs(Namespace("a:b"), Namespace("a:b"))
+
     def test_call_str_invalid(self):
         strings = [
             "grp|ns:obj",  # '|' present
@@ -35,8 +49,13 @@ class TestNamespace(TestCase):
             with self.assertRaises(ValueError) as _:
                 Namespace(s)
 
+    def test_subclass(self):
+        with self.assertRaises(TypeError) as _:
+            class Sub(Namespace):
+                pass
+
     def test_current(self):
-        self.assertEqual(Namespace.current, Namespace.root)
+        self.assertIs(Namespace.current, Namespace.root)
 
         cmds.namespace(addNamespace="ns")
         cmds.namespace(setNamespace="ns")
@@ -80,6 +99,8 @@ class TestNamespace(TestCase):
             Namespace.root:                         ":",
             _new(parent=Namespace("a"), name="b"):  "a:b",
             _new(parent=None, name="ns"):           "ns",
+            _new(parent=Namespace.root, name="ns"): ":ns",
+            _new(parent=_new(parent=Namespace(":a"), name="b"), name="c"): ":a:b:c",
         }
         for ns, expected in cases.items():
             self.assertEqual(expected, ns.str())
@@ -97,6 +118,11 @@ class TestNamespace(TestCase):
         for ns, expected in cases.items():
             self.assertEqual(expected, ns.abs())
 
+    def test_abs_shared(self):
+        rel = Namespace("a:b")
+        ns = Namespace(":a:b")
+        self.assertIs(ns, rel.abs())
+
     def test_abs_nonroot(self):
         cmds.namespace(addNamespace="ns")
         cmds.namespace(setNamespace="ns")
@@ -124,6 +150,19 @@ class TestNamespace(TestCase):
             self.assertEqual(expected, ns.is_abs())
             self.assertEqual(expected, not ns.is_rel())
 
+    def test_components(self):
+        # A list rather than a dict, as hashing would compute ns.str() first.
+        cases = [
+            (_new(parent=None, name="ns"),                                  False, 0),
+            (_new(parent=Namespace("a"), name="b"),                         False, 1),
+            (_new(parent=Namespace.root, name="b"),                         True,  1),
+            (_new(parent=_new(parent=Namespace(":a"), name="b"), name="c"), True,  3),
+        ]
+        for ns, abs_, depth in cases:
+            self.assertEqual(abs_, ns.is_abs())
+            self.assertEqual(abs_, not ns.is_rel())
+            self.assertEqual(depth, ns.depth)
+
     def test_is_root(self):
         cases = {
             Namespace(":ns"):                      False,
@@ -146,6 +185,7 @@ class TestNamespace(TestCase):
 
             Namespace(" "):                   False,
             Namespace("42"):                  False,
+            Namespace(":42"):                 False,
             Namespace("_bad"):                False,
             Namespace("rød"):                 False,
             Namespace("x-ray"):               False,
@@ -185,6 +225,14 @@ class TestNamespace(TestCase):
         for ns, expected in cases.items():
             self.assertEqual(expected, ns.depth)
 
+    def test_depth_derived(self):
+        for s in [":foo:bar:baz", "foo:bar:baz", ":foo", "foo:bar"]:
+            ns = _new(ns=s)
+            self.assertEqual(ns.depth - 1, ns.parent.depth)
+            ns = _new(ns=s)
+            _, end = ns.split_root()
+            self.assertEqual(ns.depth - 1, end.depth)
+
     def test_hierarchy(self):
         cases = {
             Namespace(":a:sample:namespace"): [
@@ -225,6 +273,17 @@ class TestNamespace(TestCase):
         for ns, expected in cases.items():
             self.assertEqual(expected, ns.split_root())
 
+    def test_split_root_root(self):
+        for s in [":a:b:c", "a:b:c", ":name", "name", ":"]:
+            root, _ = Namespace(s).split_root()
+            self.assertEqual((root, None), root.split_root())
+
+    def test_split_root_parent(self):
+        ns = _new(ns="x:y:z")
+        parent = ns.parent
+        root, _ = ns.split_root()
+        self.assertIs(root, parent.split_root()[0])
+
     def test_equality(self):
         cases = [
             (Namespace("foo:bar:test"),              Namespace("foo:bar:test")),
@@ -260,6 +319,8 @@ class TestNamespace(TestCase):
             (Namespace("a:a:b"), Namespace("a:b")),
             (Namespace(":name"), Namespace("name")),
             (Namespace("a:b:c"), Namespace("a:b:c:d")),
+            (Namespace.root,     Namespace(":a")),
+            (Namespace.root,     Namespace("a")),
         ]
         for a, b in cases:
             self.assertLess(a, b)
@@ -77,6 +77,7 @@ class TestObject(TestCase):
         obj = Object.from_name("|duplicate")
         world = Object(obj._node.parent(0))
         self.assertEqual(world, Object.world)
+        self.assertIs(Object.world, Object.world)
 
     def test_eq(self):
         a = "unique"